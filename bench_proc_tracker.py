@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# 进程跟踪器基准测试：用合成的进程表模拟拥有数千进程的主机，
+# 对比增量跟踪与每次重建 Process 对象两种方式的单次采样耗时。
+# 合成进程的属性读取、连接扫描都对 /proc/self 做真实的文件读取，
+# 开销与进程数成正比，贴近 psutil 在 Linux 上的实现：
+#   - 构造 Process: 读 /proc/<pid>/stat
+#   - oneshot(): 读 stat + statm，io_counters() 读 io
+#   - net_connections(): 对每个进程 listdir /proc/<pid>/fd 并 readlink 每个 fd
+# 最后再用真实 psutil 对当前主机计时作为对照。
+# 用法: python3 bench_proc_tracker.py [进程数] [每轮变动比例]
+import os
+import sys
+import time
+import random
+from collections import namedtuple
+from contextlib import contextmanager
+
+import psutil
+from proc_tracker import ProcessTracker
+
+MemInfo = namedtuple("MemInfo", "rss vms")
+IOCounters = namedtuple("IOCounters", "read_count write_count read_bytes write_bytes")
+CPUTimes = namedtuple("CPUTimes", "user system")
+Conn = namedtuple("Conn", "fd family type laddr raddr status pid")
+
+PROC_SELF = "/proc/self"
+
+
+def read_proc(name):
+    with open(os.path.join(PROC_SELF, name), 'rb') as f:
+        return f.read()
+
+
+class FakeTable:
+    def __init__(self, count, churn):
+        self.next_pid = 1
+        self.alive = set()
+        self.churn = churn
+        self.created = 0
+        for _ in range(count):
+            self.spawn()
+
+    def spawn(self):
+        self.alive.add(self.next_pid)
+        self.next_pid += 1
+
+    def step(self):
+        victims = random.sample(sorted(self.alive), int(len(self.alive) * self.churn))
+        for pid in victims:
+            self.alive.discard(pid)
+            self.spawn()
+
+    def pids(self):
+        return list(self.alive)
+
+    def connections(self, kind='inet'):
+        # 与 psutil 相同：先读 /proc/net/*，再遍历每个进程的 fd 目录匹配 socket inode
+        read_proc("net/tcp")
+        read_proc("net/udp")
+        conns = []
+        fd_dir = os.path.join(PROC_SELF, "fd")
+        for pid in self.alive:
+            try:
+                for fd in os.listdir(fd_dir):
+                    os.readlink(os.path.join(fd_dir, fd))
+            except OSError:
+                continue
+            if pid % 25 == 0:
+                conns.append(Conn(-1, 2, 1, None, None, 'ESTABLISHED', pid))
+        return conns
+
+    def process_cls(self, pid):
+        self.created += 1
+        return FakeProcess(pid)
+
+
+class FakeProcess:
+    def __init__(self, pid):
+        self.pid = pid
+        self._cache = None
+        self._create_time = self._create_time_from(read_proc("stat"))
+        self._cpu = 0.0
+        self._io = 0
+
+    @staticmethod
+    def _create_time_from(stat):
+        return int(stat.rsplit(b")", 1)[1].split()[19])
+
+    def _stat(self):
+        if self._cache is not None:
+            return self._cache
+        return read_proc("stat"), read_proc("statm")
+
+    @contextmanager
+    def oneshot(self):
+        self._cache = (read_proc("stat"), read_proc("statm"))
+        try:
+            yield
+        finally:
+            self._cache = None
+
+    def name(self):
+        stat = self._stat()[0]
+        return stat[stat.index(b"(") + 1:stat.rindex(b")")].decode()
+
+    def cpu_times(self):
+        fields = self._stat()[0].rsplit(b")", 1)[1].split()
+        return CPUTimes(int(fields[11]) / 100 + self._cpu, int(fields[12]) / 100)
+
+    def cpu_percent(self, interval=None):
+        self.cpu_times()
+        self._cpu += random.random()
+        return self._cpu % 100
+
+    def memory_info(self):
+        vms, rss = self._stat()[1].split()[:2]
+        return MemInfo(int(rss) * 4096, int(vms) * 4096)
+
+    def io_counters(self):
+        read_proc("io")
+        self._io += random.randint(0, 65536)
+        return IOCounters(0, 0, self._io, self._io // 2)
+
+
+def naive_sample(table):
+    # 对照组：每次采样都重新为所有 PID 构建 Process 对象（CPU 差值需 interval 阻塞，这里不计入）
+    rows = []
+    for pid in table.pids():
+        proc = table.process_cls(pid)
+        with proc.oneshot():
+            io = proc.io_counters()
+            rows.append((proc.name(), proc.cpu_percent(None), proc.memory_info().rss,
+                         io.read_bytes + io.write_bytes))
+    table.connections()
+    return rows
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+class TimedConnections:
+    # 包装 connections_func，记录 sample() 内部连接扫描步骤的实际耗时
+    def __init__(self, func):
+        self.func = func
+        self.elapsed = 0.0
+
+    def __call__(self, kind='inet'):
+        start = time.perf_counter()
+        try:
+            return self.func(kind=kind)
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+
+def bench_tracker(tracker, connections, step, rounds):
+    # 统计完整 top() 的耗时，以及其中连接扫描步骤所占的部分
+    total = []
+    connections.elapsed = 0.0
+    for _ in range(rounds):
+        step()
+        total.append(timed(tracker.top))
+    return sum(total) / rounds, connections.elapsed / rounds
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    churn = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+    rounds = 10
+    random.seed(0)
+
+    table = FakeTable(count, churn)
+    connections = TimedConnections(table.connections)
+    tracker = ProcessTracker(pids_func=table.pids, process_cls=table.process_cls,
+                             connections_func=connections)
+
+    cold = timed(tracker.top)
+    created_before = table.created
+    inc_total, inc_sockets = bench_tracker(tracker, connections, table.step, rounds)
+    created_incremental = table.created - created_before
+
+    created_before = table.created
+    naive = []
+    for _ in range(rounds):
+        table.step()
+        naive.append(timed(lambda: naive_sample(table)))
+    created_naive = table.created - created_before
+
+    print(f"== 合成进程表 ==")
+    print(f"进程数: {count}  每轮变动: {churn * 100}%  轮数: {rounds}  每进程 fd 数: {len(os.listdir('/proc/self/fd'))}")
+    print(f"冷启动采样:         {cold * 1000:.1f} ms")
+    print(f"增量采样 (平均):    {inc_total * 1000:.1f} ms, 其中连接扫描 {inc_sockets * 1000:.1f} ms, "
+          f"新建 Process 对象 {created_incremental} 个")
+    print(f"全量重建 (平均):    {sum(naive) / rounds * 1000:.1f} ms, 新建 Process 对象 {created_naive} 个")
+
+    real_connections = TimedConnections(psutil.net_connections)
+    real = ProcessTracker(connections_func=real_connections)
+    real.top()
+    real_total, real_sockets = bench_tracker(real, real_connections, lambda: None, rounds)
+    host_count = len(psutil.pids())
+    print(f"\n== 当前主机 (真实 psutil) ==")
+    print(f"进程数: {host_count}")
+    print(f"增量采样 (平均):    {real_total * 1000:.1f} ms, 其中连接扫描 {real_sockets * 1000:.1f} ms")
+    if host_count:
+        print(f"按进程折算:         {real_total / host_count * 1e6:.1f} us/进程, "
+              f"换算到 {count} 进程约 {real_total / host_count * count * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import os
+import json
+import time
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_FILE = os.path.join(BASE_DIR, 'disk_cache.json')
+
+# ================= 磁盘占用分析 =================
+# 用线程池并行 os.scandir 遍历目录，不跨越挂载点，每次扫描都 stat 全部条目。
+# 目录 mtime 只在增删/重命名条目时变化，文件原地增长（日志写满磁盘）不会改变它，
+# 因此不按 mtime 缓存或剪枝；缓存只保存上次各目录总大小 {相对路径: 字节数}，用于计算增长。
+# 硬链接文件按 (st_dev, st_ino) 只计一次，与 du 一致。
+
+class DiskAnalyzer:
+    def __init__(self, root='/', cache_file=CACHE_FILE, workers=8):
+        self.root = root
+        self.cache_file = cache_file
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._inode_lock = threading.Lock()
+        self._seen_inodes = set()
+
+    def _load_cache(self):
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r') as f:
+                cache = json.load(f)
+            if cache.get('root') != self.root or 'totals' not in cache:
+                return {}
+            return cache
+        except Exception:
+            return {}
+
+    def _save_cache(self, cache):
+        # mkstemp 生成唯一临时文件（权限 0600），Bot 与 vps-bb 同时扫描也不会互相覆盖
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.cache_file)),
+                                   prefix='.disk_cache.')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cache, f, separators=(',', ':'))
+            os.replace(tmp, self.cache_file)
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+    def _first_link(self, st):
+        if st.st_nlink <= 1:
+            return True
+        key = (st.st_dev, st.st_ino)
+        with self._inode_lock:
+            if key in self._seen_inodes:
+                return False
+            self._seen_inodes.add(key)
+            return True
+
+    def _scan_dir(self, path, dev):
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return None, []
+        if st.st_dev != dev:
+            return None, []
+
+        subdirs = []
+        size = st.st_blocks * 512
+        try:
+            with os.scandir(path) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            subdirs.append(e.path)
+                            continue
+                        est = e.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if self._first_link(est):
+                        size += est.st_blocks * 512
+        except OSError:
+            pass
+        return size, subdirs
+
+    def scan(self):
+        with self._lock:
+            start = time.monotonic()
+            old_cache = self._load_cache()
+            dev = os.lstat(self.root).st_dev
+            self._seen_inodes = set()
+
+            sizes = {}
+            parents = {}
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                pending = {pool.submit(self._scan_dir, self.root, dev): self.root}
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        path = pending.pop(fut)
+                        size, subdirs = fut.result()
+                        if size is None:
+                            continue
+                        sizes[path] = size
+                        for child in subdirs:
+                            parents[child] = path
+                            pending[pool.submit(self._scan_dir, child, dev)] = child
+            self._seen_inodes = set()
+
+            # 自底向上汇总：子目录路径总比父目录长，按长度倒序即为后序，无需递归
+            totals = dict(sizes)
+            for path in sorted(sizes, key=len, reverse=True):
+                parent = parents.get(path)
+                if parent is not None:
+                    totals[parent] += totals[path]
+
+            rel = {os.path.relpath(p, self.root): t for p, t in totals.items()}
+            self._save_cache({"root": self.root, "scanned_at": time.time(), "totals": rel})
+            previous = {os.path.normpath(os.path.join(self.root, p)): t
+                        for p, t in old_cache.get('totals', {}).items()}
+            return {
+                "totals": totals,
+                "previous": previous,
+                "previous_at": old_cache.get('scanned_at'),
+                "dir_count": len(totals),
+                "elapsed": time.monotonic() - start,
+            }
+
+    def report(self, n=10, max_depth=3):
+        result = self.scan()
+        totals = result['totals']
+        previous = result['previous']
+        base_depth = self.root.rstrip(os.sep).count(os.sep)
+
+        candidates = [p for p in totals
+                      if p != self.root and 0 < p.rstrip(os.sep).count(os.sep) - base_depth <= max_depth]
+
+        largest = sorted(((p, totals[p]) for p in candidates),
+                         key=lambda x: x[1], reverse=True)[:n]
+
+        growth = []
+        if previous:
+            for p in candidates:
+                delta = totals[p] - previous.get(p, 0)
+                if delta > 0:
+                    growth.append((p, delta))
+            growth = sorted(growth, key=lambda x: x[1], reverse=True)[:n]
+
+        return {
+            "total": totals.get(self.root, 0),
+            "largest": largest,
+            "growth": growth,
+            "previous_at": result['previous_at'],
+            "dir_count": result['dir_count'],
+            "elapsed": result['elapsed'],
+        }
@@ -13,6 +13,8 @@ INSTALL_DIR="/opt/vpsbot"
 SERVICE_FILE="/etc/systemd/system/vpsbot.service"
 GITHUB_VPS_BOT="https://raw.githubusercontent.com/alllike996/vps-bot-manager/main/vps_bot.py"
 GITHUB_VPS_BB="https://raw.githubusercontent.com/alllike996/vps-bot-manager/main/vps_bb.py"
+GITHUB_PROC_TRACKER="https://raw.githubusercontent.com/alllike996/vps-bot-manager/main/proc_tracker.py"
+GITHUB_DISK_ANALYZER="https://raw.githubusercontent.com/alllike996/vps-bot-manager/main/disk_analyzer.py"
 
 echo -e "${GREEN}=========================================${NC}"
 echo -e "${GREEN}      VPS Telegram Bot 一键安装脚本      ${NC}"
@@ -58,9 +60,11 @@ systemctl restart vnstat
 echo -e "${GREEN}⏳ 正在下载脚本文件...${NC}"
 mkdir -p "$INSTALL_DIR"
 
-# 下载主程序和快捷管理脚本
+# 下载主程序、快捷管理脚本及依赖模块
 curl -sL "$GITHUB_VPS_BOT" -o "$INSTALL_DIR/vps_bot.py"
 curl -sL "$GITHUB_VPS_BB" -o "$INSTALL_DIR/vps_bb.py"
+curl -sL "$GITHUB_PROC_TRACKER" -o "$INSTALL_DIR/proc_tracker.py"
+curl -sL "$GITHUB_DISK_ANALYZER" -o "$INSTALL_DIR/disk_analyzer.py"
 chmod +x "$INSTALL_DIR/vps_bb.py"
 
 if [ ! -f "$INSTALL_DIR/vps_bot.py" ]; then
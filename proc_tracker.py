@@ -0,0 +1,135 @@
+import time
+import heapq
+import threading
+import psutil
+
+# ================= 进程表增量跟踪 =================
+# 在两次采样之间保留 psutil.Process 对象，cpu_percent(None) 依赖上一次调用
+# 记录的 CPU 时间计算差值，因此无需 interval 阻塞等待。
+# 每次采样只对新出现/已消失的 PID 做增删，属性统一在 oneshot() 中读取。
+# 新出现的进程在下一次采样前 CPU 与 I/O 速率均记为 0。
+# PID 复用根据 oneshot() 已读到的数据判断：进程名变化或累计 CPU 时间倒退，
+# 不再为每个进程额外读一次 /proc/<pid>/stat。
+
+class ProcessTracker:
+    def __init__(self, pids_func=psutil.pids, process_cls=psutil.Process,
+                 connections_func=psutil.net_connections):
+        self._pids_func = pids_func
+        self._process_cls = process_cls
+        self._connections_func = connections_func
+        self._procs = {}      # pid -> Process
+        self._last_io = {}    # pid -> (read_bytes + write_bytes)
+        self._ident = {}      # pid -> (name, 累计 CPU 秒数)，用于识别 PID 复用
+        self._last_time = None
+        self._lock = threading.Lock()
+
+    def _forget(self, pid):
+        self._procs.pop(pid, None)
+        self._last_io.pop(pid, None)
+        self._ident.pop(pid, None)
+
+    def _track(self, pid):
+        try:
+            self._procs[pid] = self._process_cls(pid)
+            return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return False
+
+    def _refresh(self):
+        # 返回本轮新加入跟踪的 PID，这些进程尚无上一次的 CPU/IO 基准
+        current = set(self._pids_func())
+        known = set(self._procs)
+        for pid in known - current:
+            self._forget(pid)
+        return {pid for pid in current - known if self._track(pid)}
+
+    def _socket_counts(self):
+        counts = {}
+        try:
+            conns = self._connections_func(kind='inet')
+        except (psutil.AccessDenied, OSError):
+            return counts
+        for conn in conns:
+            if conn.pid:
+                counts[conn.pid] = counts.get(conn.pid, 0) + 1
+        return counts
+
+    def _read(self, proc):
+        with proc.oneshot():
+            name = proc.name()
+            times = proc.cpu_times()
+            cpu = proc.cpu_percent(None)
+            rss = proc.memory_info().rss
+            try:
+                io = proc.io_counters()
+                io_total = io.read_bytes + io.write_bytes
+            except (psutil.AccessDenied, AttributeError):
+                io_total = None
+        return name, times.user + times.system, cpu, rss, io_total
+
+    def sample(self):
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_time if self._last_time else 0
+            self._last_time = now
+            fresh = self._refresh()
+            sockets = self._socket_counts()
+
+            rows = []
+            gone = []
+            for pid in list(self._procs):
+                try:
+                    name, cpu_total, cpu, rss, io_total = self._read(self._procs[pid])
+                    ident = self._ident.get(pid)
+                    if pid not in fresh and ident and (ident[0] != name or cpu_total < ident[1]):
+                        # PID 已被新进程复用：换成新的 Process 对象，按新进程处理
+                        self._forget(pid)
+                        if not self._track(pid):
+                            continue
+                        fresh.add(pid)
+                        name, cpu_total, cpu, rss, io_total = self._read(self._procs[pid])
+                except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                    gone.append(pid)
+                    continue
+                except psutil.AccessDenied:
+                    continue
+                self._ident[pid] = (name, cpu_total)
+
+                # 新进程的首次调用只记录基准，间隔仅几毫秒的读数没有意义
+                if pid in fresh:
+                    cpu = 0.0
+
+                io_rate = 0
+                if io_total is not None:
+                    last = self._last_io.get(pid)
+                    if last is not None and pid not in fresh and elapsed > 0:
+                        io_rate = max(io_total - last, 0) / elapsed
+                    self._last_io[pid] = io_total
+
+                rows.append({
+                    "pid": pid,
+                    "name": name,
+                    "cpu": cpu,
+                    "rss": rss,
+                    "io_rate": io_rate,
+                    "sockets": sockets.get(pid, 0),
+                })
+
+            for pid in gone:
+                self._forget(pid)
+            return rows, elapsed
+
+    def top(self, n=5):
+        rows, elapsed = self.sample()
+
+        def pick(key):
+            return [r for r in heapq.nlargest(n, rows, key=lambda r: r[key]) if r[key] > 0]
+
+        return {
+            "cpu": pick("cpu"),
+            "rss": pick("rss"),
+            "io_rate": pick("io_rate"),
+            "sockets": pick("sockets"),
+            "count": len(rows),
+            "elapsed": elapsed,
+        }
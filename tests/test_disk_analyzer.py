@@ -0,0 +1,96 @@
+import os
+import sys
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from disk_analyzer import DiskAnalyzer
+
+
+def make_analyzer(tmp_path):
+    root = tmp_path / "root"
+    (root / "log").mkdir(parents=True)
+    (root / "data").mkdir()
+    return root, DiskAnalyzer(str(root), cache_file=str(tmp_path / "cache.json"), workers=4)
+
+
+def test_small_file_growing_in_place_is_reported(tmp_path):
+    root, analyzer = make_analyzer(tmp_path)
+    syslog = root / "log" / "syslog"
+    syslog.write_bytes(b"x" * 1000)
+    mtime_before = os.stat(root / "log").st_mtime_ns
+
+    first = analyzer.report()
+    assert first['previous_at'] is None
+
+    with open(syslog, 'ab') as f:
+        f.write(os.urandom(50 * 1024 * 1024))
+    assert os.stat(root / "log").st_mtime_ns == mtime_before
+
+    second = analyzer.report()
+    log_path = str(root / "log")
+    assert dict(second['largest'])[log_path] >= 50 * 1024 * 1024
+    assert second['growth'][0][0] == log_path
+    assert second['growth'][0][1] >= 50 * 1024 * 1024
+
+
+def test_new_and_removed_entries_are_picked_up(tmp_path):
+    root, analyzer = make_analyzer(tmp_path)
+    (root / "data" / "a").write_bytes(os.urandom(200000))
+    analyzer.report()
+
+    (root / "data" / "a").unlink()
+    (root / "log" / "new").mkdir()
+    (root / "log" / "new" / "b").write_bytes(os.urandom(300000))
+
+    report = analyzer.report()
+    totals = dict(report['largest'])
+    assert totals.get(str(root / "data"), 0) < 200000
+    assert totals[str(root / "log" / "new")] >= 300000
+    assert {p for p, _ in report['growth']} == {str(root / "log"), str(root / "log" / "new")}
+
+
+def test_hard_links_are_counted_once(tmp_path):
+    root, analyzer = make_analyzer(tmp_path)
+    original = root / "data" / "blob"
+    original.write_bytes(os.urandom(10 * 1024 * 1024))
+    for i in range(5):
+        os.link(original, root / "log" / f"link{i}")
+
+    report = analyzer.report()
+    assert report['total'] < 11 * 1024 * 1024
+
+
+def test_deep_tree_does_not_hit_recursion_limit(tmp_path):
+    root, analyzer = make_analyzer(tmp_path)
+    depth = sys.getrecursionlimit() + 100
+    # 逐级 chdir 创建，避免绝对路径超过 PATH_MAX
+    cwd = os.getcwd()
+    try:
+        os.chdir(root / "data")
+        for _ in range(depth):
+            os.mkdir("d")
+            os.chdir("d")
+        with open("leaf", "wb") as f:
+            f.write(os.urandom(100000))
+    finally:
+        os.chdir(cwd)
+
+    analyzer.report()
+    report = analyzer.report()
+    assert report['dir_count'] >= depth
+    assert dict(report['largest'])[str(root / "data")] >= 100000
+
+
+def test_cache_is_private_and_flat(tmp_path):
+    root, analyzer = make_analyzer(tmp_path)
+    (root / "log" / "secret-name").write_bytes(b"x")
+    analyzer.report()
+
+    cache_file = tmp_path / "cache.json"
+    assert os.stat(cache_file).st_mode & 0o777 == 0o600
+    with open(cache_file) as f:
+        cache = json.load(f)
+    assert set(cache['totals']) == {".", "log", "data"}
+    assert "secret-name" not in json.dumps(cache)
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".disk_cache.")] == []
@@ -0,0 +1,179 @@
+import os
+import sys
+from collections import namedtuple
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psutil
+from proc_tracker import ProcessTracker
+
+CPUTimes = namedtuple("CPUTimes", "user system")
+MemInfo = namedtuple("MemInfo", "rss vms")
+IOCounters = namedtuple("IOCounters", "read_count write_count read_bytes write_bytes")
+Conn = namedtuple("Conn", "fd family type laddr raddr status pid")
+
+
+class FakeHost:
+    # pid -> 当前占用该 PID 的进程状态，相当于 /proc/<pid>
+    def __init__(self):
+        self.table = {}
+        self.sockets = {}
+        self.created = []
+
+    def run(self, pid, name, cpu=0.0, cpu_total=1.0, rss=1024, io=0):
+        self.table[pid] = {"name": name, "cpu": cpu, "cpu_total": cpu_total, "rss": rss, "io": io}
+
+    def pids(self):
+        return list(self.table)
+
+    def connections(self, kind='inet'):
+        return [Conn(-1, 2, 1, None, None, 'ESTABLISHED', pid)
+                for pid, count in self.sockets.items() for _ in range(count)]
+
+    def process(self, pid):
+        if pid not in self.table:
+            raise psutil.NoSuchProcess(pid)
+        proc = FakeProcess(self, pid)
+        self.created.append(proc)
+        return proc
+
+    def tracker(self):
+        return ProcessTracker(pids_func=self.pids, process_cls=self.process,
+                              connections_func=self.connections)
+
+
+class FakeProcess:
+    def __init__(self, host, pid):
+        self.host = host
+        self.pid = pid
+
+    def _state(self):
+        if self.pid not in self.host.table:
+            raise psutil.NoSuchProcess(self.pid)
+        return self.host.table[self.pid]
+
+    @contextmanager
+    def oneshot(self):
+        yield
+
+    def name(self):
+        return self._state()["name"]
+
+    def cpu_times(self):
+        return CPUTimes(self._state()["cpu_total"], 0.0)
+
+    def cpu_percent(self, interval=None):
+        return self._state()["cpu"]
+
+    def memory_info(self):
+        return MemInfo(self._state()["rss"], 0)
+
+    def io_counters(self):
+        return IOCounters(0, 0, self._state()["io"], 0)
+
+
+def row(rows, pid):
+    return next(r for r in rows if r["pid"] == pid)
+
+
+def test_new_pid_reports_zero_cpu_and_io_on_first_sample():
+    host = FakeHost()
+    host.run(1, "init", cpu=50.0, io=1000)
+    tracker = host.tracker()
+
+    rows, _ = tracker.sample()
+    assert row(rows, 1)["cpu"] == 0.0
+    assert row(rows, 1)["io_rate"] == 0
+
+    host.run(2, "worker", cpu=80.0, io=5000)
+    host.table[1]["io"] = 3000
+    rows, _ = tracker.sample()
+    assert row(rows, 1)["cpu"] == 50.0
+    assert row(rows, 1)["io_rate"] > 0
+    assert row(rows, 2)["cpu"] == 0.0
+    assert row(rows, 2)["io_rate"] == 0
+
+
+def test_reused_pid_is_replaced_and_io_baseline_dropped():
+    host = FakeHost()
+    host.run(7, "nginx", cpu=30.0, cpu_total=500.0, io=10 ** 9)
+    tracker = host.tracker()
+    tracker.sample()
+    tracker.sample()
+    old_proc = tracker._procs[7]
+
+    # 旧进程退出后 PID 7 被一个新进程占用，I/O 计数从头开始
+    host.run(7, "sh", cpu=90.0, cpu_total=0.1, io=4096)
+    rows, _ = tracker.sample()
+    assert tracker._procs[7] is not old_proc
+    assert row(rows, 7)["name"] == "sh"
+    assert row(rows, 7)["cpu"] == 0.0
+    assert row(rows, 7)["io_rate"] == 0
+    assert tracker._last_io[7] == 4096
+
+    host.table[7]["io"] = 8192
+    rows, _ = tracker.sample()
+    assert row(rows, 7)["cpu"] == 90.0
+    assert row(rows, 7)["io_rate"] > 0
+
+
+def test_reused_pid_with_same_name_detected_by_cpu_time():
+    host = FakeHost()
+    host.run(9, "python", cpu_total=100.0)
+    tracker = host.tracker()
+    tracker.sample()
+    old_proc = tracker._procs[9]
+
+    host.run(9, "python", cpu_total=0.5)
+    tracker.sample()
+    assert tracker._procs[9] is not old_proc
+
+
+def test_known_pids_are_not_reconstructed():
+    host = FakeHost()
+    for pid in range(1, 6):
+        host.run(pid, f"p{pid}")
+    tracker = host.tracker()
+    tracker.sample()
+    tracker.sample()
+    tracker.sample()
+    assert len(host.created) == 5
+
+
+def test_vanished_pid_is_forgotten():
+    host = FakeHost()
+    host.run(1, "init", io=100)
+    host.run(2, "cron", io=100)
+    tracker = host.tracker()
+    tracker.sample()
+
+    del host.table[2]
+    rows, _ = tracker.sample()
+    assert [r["pid"] for r in rows] == [1]
+    assert 2 not in tracker._procs
+    assert 2 not in tracker._last_io
+    assert 2 not in tracker._ident
+
+
+def test_top_orders_each_metric():
+    host = FakeHost()
+    host.run(1, "a", cpu=10.0, rss=300, io=0)
+    host.run(2, "b", cpu=70.0, rss=100, io=0)
+    host.run(3, "c", cpu=40.0, rss=200, io=0)
+    host.run(4, "idle", cpu=0.0, rss=50, io=0)
+    host.sockets = {3: 5, 1: 2}
+    tracker = host.tracker()
+    tracker.sample()
+
+    host.table[1]["io"] = 100
+    host.table[3]["io"] = 900
+    top = tracker.top(n=2)
+    assert [r["pid"] for r in top["cpu"]] == [2, 3]
+    assert [r["pid"] for r in top["rss"]] == [1, 3]
+    assert [r["pid"] for r in top["io_rate"]] == [3, 1]
+    assert [(r["pid"], r["sockets"]) for r in top["sockets"]] == [(3, 5), (1, 2)]
+    assert top["count"] == 4
+
+    top = tracker.top(n=10)
+    assert 4 not in [r["pid"] for r in top["cpu"]]
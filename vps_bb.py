@@ -6,8 +6,9 @@ import psutil
 import subprocess
 from datetime import datetime
 import shutil
+from disk_analyzer import DiskAnalyzer
 
-VERSION = "v2.1.1"
+VERSION = "v2.2.0"
 
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), 'config.json')
 INSTALL_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -148,6 +149,34 @@ def show_traffic():
     except Exception as e:
         print(f"{RED}⚠️ 无法获取流量: {e}{RESET}")
 
+def show_disk_usage():
+    print(f"{YELLOW}⏳ 正在扫描磁盘 (仅根分区)...{RESET}")
+    try:
+        report = DiskAnalyzer('/').report(n=10)
+    except Exception as e:
+        print(f"{RED}⚠️ 磁盘分析失败: {e}{RESET}")
+        return
+
+    print(f"\n{CYAN}{BOLD}💽 磁盘占用分析{RESET}")
+    print(f"已扫描: {round(report['total']/1024**3, 2)} GB | 目录数: {report['dir_count']} "
+          f"| 耗时: {round(report['elapsed'], 2)} 秒\n")
+
+    print(f"📊 最大目录:")
+    for path, size in report['largest']:
+        print(f"  {round(size/1024**2, 1):>10} MB  {path}")
+
+    print(f"\n📈 增长最多:")
+    if report['previous_at'] is None:
+        print(f"  {YELLOW}首次扫描，下次扫描后显示增长{RESET}")
+    elif not report['growth']:
+        print(f"  {GREEN}无增长{RESET}")
+    else:
+        last = datetime.fromtimestamp(report['previous_at']).strftime("%Y-%m-%d %H:%M:%S")
+        print(f"  (对比 {last})")
+        for path, size in report['growth']:
+            print(f"  {RED}+{round(size/1024**2, 1):>9} MB{RESET}  {path}")
+    print()
+
 # ===================== 系统操作 =====================
 def reboot_vps():
     confirm = input(f"{RED}⚠️ 确定要重启 VPS 吗? (y/n): {RESET}").lower()
@@ -230,6 +259,7 @@ def menu():
 {YELLOW}9) 重启管理脚本{RESET}
 {YELLOW}10) 停止管理脚本{RESET}
 {RED}11) 卸载管理脚本{RESET}
+{GREEN}12) 磁盘占用分析{RESET}
 {YELLOW}0) 退出{RESET}
 ========================
 """)
@@ -258,6 +288,8 @@ def menu():
             stop_script()
         elif choice == '11':
             uninstall_script()
+        elif choice == '12':
+            show_disk_usage()
         elif choice == '0':
             print(f"{YELLOW}退出管理面板{RESET}")
             break
@@ -10,6 +10,8 @@ import time
 from datetime import datetime
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ContextTypes
+from proc_tracker import ProcessTracker
+from disk_analyzer import DiskAnalyzer
 
 # ================= 基础配置 =================
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -21,7 +23,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-VERSION = "v3.8.2"   # 小版本升级，方便区分
+VERSION = "v3.10.0"   # 小版本升级，方便区分
 
 config = {
     "bot_token": "",
@@ -100,6 +102,75 @@ def get_system_status():
     )
     return msg
 
+# ================= 进程排行 =================
+proc_tracker = ProcessTracker()
+
+def format_bytes(num):
+    for unit in ("B", "K", "M", "G"):
+        if num < 1024:
+            return f"{round(num, 1)}{unit}"
+        num /= 1024
+    return f"{round(num, 1)}T"
+
+def get_top_processes(n=5):
+    try:
+        top = proc_tracker.top(n)
+    except Exception as e:
+        logger.error(f"Process tracker error: {e}")
+        return f"⚠️ 获取进程信息失败: {e}"
+
+    def section(title, rows, fmt):
+        lines = [f"{title}"]
+        if not rows:
+            lines.append("  (暂无数据)")
+        for r in rows:
+            lines.append(f"  {r['pid']:>7} {r['name'][:16]:<16} {fmt(r)}")
+        return "\n".join(lines)
+
+    body = "\n\n".join([
+        section("CPU", top['cpu'], lambda r: f"{round(r['cpu'], 1)}%"),
+        section("内存 (RSS)", top['rss'], lambda r: format_bytes(r['rss'])),
+        section("磁盘 I/O", top['io_rate'], lambda r: f"{format_bytes(r['io_rate'])}/s"),
+        section("网络连接数", top['sockets'], lambda r: str(r['sockets'])),
+    ])
+    if top['elapsed']:
+        window = f"最近 {round(top['elapsed'], 1)} 秒"
+    else:
+        window = "首次采样，CPU/IO 数据将在下次刷新后显示"
+    return (
+        f"🔥 **进程资源排行 (Top {n})**\n"
+        f"-------------------\n"
+        f"📦 进程数: {top['count']} | ⏱ {window}\n"
+        f"```\n{body}\n```"
+    )
+
+# ================= 磁盘占用分析 =================
+disk_analyzer = DiskAnalyzer('/')
+
+def get_disk_report(n=8):
+    try:
+        report = disk_analyzer.report(n=n)
+    except Exception as e:
+        logger.error(f"Disk analyzer error: {e}")
+        return f"⚠️ 磁盘分析失败: {e}"
+
+    largest = "\n".join(f"{format_bytes(size):>8}  {path}" for path, size in report['largest']) or "(暂无数据)"
+    if report['previous_at'] is None:
+        growth = "首次扫描，下次扫描后显示增长"
+    else:
+        growth = "\n".join(f"+{format_bytes(size):>7}  {path}" for path, size in report['growth']) or "无增长"
+        last = datetime.fromtimestamp(report['previous_at']).strftime("%Y-%m-%d %H:%M:%S")
+        growth = f"对比 {last}\n{growth}"
+    return (
+        f"💽 **磁盘占用分析**\n"
+        f"-------------------\n"
+        f"📦 根分区已扫描: {format_bytes(report['total'])}\n"
+        f"📂 目录数: {report['dir_count']}\n"
+        f"⏱ 耗时: {round(report['elapsed'], 2)} 秒\n\n"
+        f"📊 最大目录:\n```\n{largest}\n```\n"
+        f"📈 增长最多:\n```\n{growth}\n```"
+    )
+
 # ================= 流量状态 =================
 def get_traffic_status():
     reload_config()
@@ -230,9 +301,11 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
          InlineKeyboardButton("📡 流量统计", callback_data='traffic')],
         [InlineKeyboardButton("🔐 SSH 登录记录", callback_data='ssh_logs'),
          InlineKeyboardButton("❌ SSH 失败记录", callback_data='ssh_fail_logs')],
-        [InlineKeyboardButton("⛔ Fail2Ban 封禁统计", callback_data='fail2ban')],
+        [InlineKeyboardButton("⛔ Fail2Ban 封禁统计", callback_data='fail2ban'),
+         InlineKeyboardButton("🔥 进程排行", callback_data='top_procs')],
         [InlineKeyboardButton("⚙️ 设置流量阈值", callback_data='setup_limit')],
-        [InlineKeyboardButton("🧹 清理缓存日志", callback_data='clean_logs')],
+        [InlineKeyboardButton("🧹 清理缓存日志", callback_data='clean_logs'),
+         InlineKeyboardButton("💽 磁盘分析", callback_data='disk_usage')],
         [InlineKeyboardButton("🔄 重启 VPS", callback_data='reboot'),
          InlineKeyboardButton("🛑 立即关机", callback_data='shutdown')],
         [InlineKeyboardButton("❌ 关闭菜单", callback_data='close')]
@@ -326,6 +399,25 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             msg = f"⚠️ 获取失败: {e}"
     elif query.data == 'fail2ban':
         msg = get_fail2ban_stats()
+    elif query.data == 'top_procs':
+        msg = await asyncio.to_thread(get_top_processes)
+        await query.edit_message_text(msg,
+                                      reply_markup=InlineKeyboardMarkup(
+                                          [[InlineKeyboardButton("🔄 刷新", callback_data='top_procs'),
+                                            InlineKeyboardButton("🔙 返回菜单", callback_data='menu')]]
+                                      ),
+                                      parse_mode='Markdown')
+        return
+    elif query.data == 'disk_usage':
+        await query.edit_message_text("💽 正在扫描磁盘，请稍候...")
+        msg = await asyncio.to_thread(get_disk_report)
+        await query.edit_message_text(msg,
+                                      reply_markup=InlineKeyboardMarkup(
+                                          [[InlineKeyboardButton("🔄 重新扫描", callback_data='disk_usage'),
+                                            InlineKeyboardButton("🔙 返回菜单", callback_data='menu')]]
+                                      ),
+                                      parse_mode='Markdown')
+        return
     elif query.data == 'setup_limit':
         reload_config()
         keyboard = [
@@ -408,6 +500,8 @@ async def check_traffic_job(context: ContextTypes.DEFAULT_TYPE):
 # ================= 启动 SSH 监听 =================
 async def on_startup(app: Application):
     app.create_task(monitor_ssh_login(app))
+    # 预热进程表，使首次查看排行时 CPU 差值已有基准
+    await asyncio.to_thread(proc_tracker.sample)
 
 # ================= 主程序 =================
 def main():